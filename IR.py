@@ -1,55 +1,49 @@
-import urllib2
 import re
+import string
+import itertools
+import http_session
+from http_session import session
+
+
+_TAG_RE = re.compile(r'<[a-zA-Z0-9/\\\-%#@()!\$:\^`~&|\*\"\'\,\[\]=\+\._ ;?]+>')
+_CITE_RE = re.compile(r'\[[0-9]+\]')
+_DOTS_RE = re.compile(r'\.+')
+_ST_RE = re.compile(r'<span class="st">(.*?)</span>', re.DOTALL)
+_ALLOWED = set(string.ascii_letters + string.digits + '/\\-%#@()!$:^`~&|*"\',[]=+._ ;?<>')
+_DROP_CHARS = ''.join(c for c in map(chr, range(256)) if c not in _ALLOWED)
 
 
 def clean_para(para):
-        para = re.sub(r'<[a-zA-Z0-9/\\\-%#@()!\$:\^`~&|\*\"\'\,\[\]=\+\._ ;?]+>', "", para)
-        para = re.sub(r'\[[0-9]+\]', "", para)
-        para = re.sub(r'\[\.\.\.\]', "", para)
-        para = re.sub(r'more>', "", para)
-        para = re.sub(r'>', "", para)
-        para = re.sub(r'<', "", para)
-        para = re.sub(r'[\.]+', ".", para)
-        para = re.sub(r'\n\n', "", para)
-        para = re.sub(r'#39', "", para)
-        para = re.sub(r'&middot', "", para)
-        para = re.sub(r'[^a-zA-Z0-9/\\\-%#@()!\$:\^`~&|\*"\'\,\[\]=\+\._ ;?<>]', "", para)
+        #Each removal can expose a match for a later one, so the steps keep
+        #their original order
+        para = _TAG_RE.sub("", para)
+        para = _CITE_RE.sub("", para)
+        para = para.replace('[...]', "")
+        para = para.replace('more>', "")
+        para = para.translate(None, '<>')
+        para = _DOTS_RE.sub(".", para)
+        para = para.replace('\n\n', "")
+        para = para.replace('#39', "")
+        para = para.replace('&middot', "")
+        para = para.translate(None, _DROP_CHARS)
         para = ' '.join(para.split())
         return para
 
 
-def write_file(text):
-    write_para = clean_para(text)
-    fob=open('C:\Python27\BTP\para.txt','a')
-    fob.write(write_para)
-    fob.write('\n\n')
-    fob.close
-    
-
-def get_next_target(page):
-    start_text = page.find('<span class="st">')
-    end_text = page.find('</span>', start_text + 1)
-    text = page[start_text + 17:end_text]
-    return text, end_text
-    
-
 def ret_sourcecode(query):
         query = query.replace(' ','+')
         url = "http://www.google.com/search?q="+query
-        req = urllib2.Request(url,headers={'User-Agent':'Magic Browser'})
-        con = urllib2.urlopen(req)
-        return con.read()
+        con = session.get(url,headers={'User-Agent':'Magic Browser'},timeout=10)
+        con.raise_for_status()
+        return con.content
 
 
 
 
 def get_all_links(query):
     source_code = ret_sourcecode(query)
-    page = source_code
-    for b in range(0,10):
-        text,endpos = get_next_target(page)
-        write_file(text)
-        page = page[endpos:]
+    texts = [m.group(1) for m in itertools.islice(_ST_RE.finditer(source_code), 10)]
+    return [clean_para(text) for text in texts]
 
 
 
@@ -1,21 +1,39 @@
 import re
 
-text = open('abbrtemp.txt','r').read().split('\n')
+#The abbreviation after 'of' (full form of X) or 'does' (what does X stand
+#for), skipping filler words such as 'the acronym'; dots are allowed so that
+#u.s.a is captured whole
+_ABBR_WORD_RE = re.compile(r'\b(?:of|does)\s+(?:(?:the|an?|acronym|abbreviation)\s+)*([\w.]+)', re.IGNORECASE)
+
+_abbreviations = None
+
+#Each line of abbrtemp.txt is ABBR\x97full form. The list is parsed into a
+#dict on the first ABBR question only and then kept for the rest of the process
+def load_abbreviations() :
+    global _abbreviations
+    if _abbreviations is None :
+        with open('abbrtemp.txt','r') as f :
+            text = f.read()
+        _abbreviations = {normalise(abbr): full.strip()
+                          for abbr, sep, full in (line.partition('\x97') for line in text.splitlines())
+                          if sep and normalise(abbr)}
+    return _abbreviations
+
+#Keys and lookups share one form: no dots, no surrounding space, upper case
+def normalise(abbr) :
+    return abbr.replace('.','').strip().upper()
 
 def ret_full_form(abbr) :
-    abbr = abbr.upper()
-    for f in text :
-        if f.find(abbr) != -1 :
-            return f[f.find('\x97')+1:]
+    return load_abbreviations().get(normalise(abbr))
 
 def find_word(question) :
-    q = re.sub(r' ','',question)
-    if q.find('of') != -1 :
-        return q[q.find('of')+2:q.find('?')]
-    if q.find('does') != -1 :
-        return q2[q2.find('does')+5:q2.find('stand')-1]
+    m = _ABBR_WORD_RE.search(question)
+    if m :
+        return m.group(1).replace('.','')
 
 def answer_abbreviations(question) :
     abbr = find_word(question)
     print 'Abbreviation', abbr
+    if abbr is None :
+        return None
     return ret_full_form(abbr)
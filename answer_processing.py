@@ -1,58 +1,104 @@
 import re
-import nltk
-import mechanize
+import shelve
+import hashlib
+import http_session
+from http_session import session
 import abbreviations
 from abbreviations import answer_abbreviations
 
+_NONUPPER_RE = re.compile(r'[^A-Z]+')
+#First sentence of the tagged text, which starts on the line after the
+#third </div> following the NER form
+_NER_ANS_RE = re.compile(r'</FORM>.*?</div>.*?</div>.*?</div>[^\n]*\n([^.]*)\.', re.DOTALL)
+
+#The 7 class MUC model is the one that tags PERSON, LOCATION and DATE
+_NER_URL = 'http://nlp.stanford.edu:8080/ner/process'
+_NER_PARAMS = {'classifier': 'english.muc.7class.distsim.crf.ser.gz',
+               'outputFormat': 'slashTags',
+               'preserveSpacing': 'yes'}
+#Cache entries are keyed on the endpoint and form fields as well as the text,
+#so changing either never serves output tagged by the old configuration
+_NER_CONFIG = repr((_NER_URL, sorted(_NER_PARAMS.items())))
+_NER_CACHE_SIZE = 1024
+#Shelve key holding the cached keys, least recently used first
+_NER_ORDER_KEY = '__order__'
+
+_ner_cache = None
+
+def get_ner_cache() :
+    global _ner_cache
+    if _ner_cache is None :
+        _ner_cache = shelve.open('C:/Python27/BTP/ner_cache')
+        #A shelf without the order list predates the bound and the config
+        #keyed entries, so none of its entries can be reused or evicted
+        if _NER_ORDER_KEY not in _ner_cache :
+            _ner_cache.clear()
+            _ner_cache[_NER_ORDER_KEY] = []
+    return _ner_cache
+
+#Posts straight to the demo form's action
+def fetch_NER_string(answer_candidate) :
+    data = dict(_NER_PARAMS, input=answer_candidate)
+    resp = session.post(_NER_URL, data=data, timeout=30)
+    resp.raise_for_status()
+    return resp.content
+
+#Tagged output is cached on disk so that repeated candidates, within a run or
+#across runs, skip the NER server. Only successful responses are stored; a
+#failed request raises first. The cache holds the _NER_CACHE_SIZE most
+#recently used entries and drops the least recently used past that
 def NER_string(answer_candidate) :
-    br = mechanize.Browser()
-    br.open('http://nlp.stanford.edu:8080/ner/')
-    #for f in br.forms() :
-    #    print f
-    br.select_form(nr=0)
-    br.form['input']=answer_candidate
-    br.form['outputFormat']=['slashTags']
-    br.submit()
-    return br.response().read()
+    cache = get_ner_cache()
+    key = hashlib.md5(_NER_CONFIG + answer_candidate).hexdigest()
+    order = cache.get(_NER_ORDER_KEY, [])
+    if key in cache :
+        order.remove(key)
+        order.append(key)
+        cache[_NER_ORDER_KEY] = order
+        return cache[key]
+    nertext = fetch_NER_string(answer_candidate)
+    cache[key] = nertext
+    order.append(key)
+    while len(order) > _NER_CACHE_SIZE :
+        del cache[order.pop(0)]
+    cache[_NER_ORDER_KEY] = order
+    cache.sync()
+    return nertext
 
 def extract_ans(nertext):
-	s1 = nertext.find('</FORM>')
-	s2 = nertext.find('</div>',s1+1)
-	s3 = nertext.find('</div>',s2+1)
-	s4 = nertext.find('</div>',s3+1)
-	s5 = nertext.find('\n',s4)
-	s6 = nertext.find('.',s5+1)
-	return nertext[s5+1:s6]
+	m = _NER_ANS_RE.search(nertext)
+	return m.group(1) if m else ''
 
 def parse_answer(answer,answer_type) :
 	answer = answer.replace(answer_type,'')
-	answer = re.sub(r'/','',answer)
+	answer = answer.replace('/','')
 	return answer
 
-def answer_the_question(answers, answer_type, final, imp_sentences) :
-    i = 0
-    for answer in answers :
+def answer_the_question(answer_type, final, imp_sentences) :
+    for i in imp_sentences :
         """
         #Next line returns source code
         nertext = NER_string(answer)
         #Next lines extracts the tagged sentence from the source code
         final = extract_ans(nertext)
         """
-        final_sentence = final[imp_sentences[i]]
-        i += 1
+        final_sentence = final[i]
         save = ""
         flag = False
-        for f in nltk.word_tokenize(final_sentence):
-            if f.find(answer_type) != -1 :
+        #NER output is whitespace separated word/TAG tokens
+        for f in final_sentence.split():
+            if answer_type in f :
                 flag = True
                 save = save + parse_answer(f,answer_type) + ' '
-            else:
-                if flag == True and f.find(answer_type) == -1 :
-                    return save
+            elif flag :
+                return save
+        #The tagged run can also end the sentence
+        if flag :
+            return save
 
 
 def find_abbreviation(question) :
-    question = re.sub(r'[a-z ]+','',temp)
+    question = _NONUPPER_RE.sub('',question)
     return question
 
 """
@@ -66,6 +112,5 @@ def answer_abbreviation(question) :
 def answer_processing(answer_type, question, final, imp_sentences) :
     if answer_type == "ABBR" :
         return answer_abbreviations(question)
-    answers = open('C:\Python27\BTP\imp_sentences.txt').read().split('.')
-    save = answer_the_question(answers, answer_type, final, imp_sentences)
+    save = answer_the_question(answer_type, final, imp_sentences)
     return save
@@ -10,22 +10,22 @@ from nltk.corpus import stopwords
 #syns = wn.synsets('country')
 #syns
 
-stopwords = stopwords.words('english')
+#Loaded once at import, as a set for constant-time membership tests
+stopwords = frozenset(stopwords.words('english'))
 len(stopwords)
 
 #Stemming
+stemmer = nltk.stem.porter.PorterStemmer()
+
 def ret_stemmed_query(query) :
-    stemmer = nltk.stem.porter.PorterStemmer()
     qstem = []
     for q in nltk.word_tokenize(query) :
-        qstem.append(stemmer.stem_word(q))
+        qstem.append(stemmer.stem(q))
+    return qstem
 
 def remove_stopwords(question) :
-    query = []
-    for q in nltk.word_tokenize(question):
-        if q not in stopwords :
-            query.append(q)
-    return query
+    #Punctuation is already gone, so whitespace separates the tokens
+    return [q for q in question.split() if q not in stopwords]
 
 table = string.maketrans('','')
 def clean(question) :
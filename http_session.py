@@ -0,0 +1,10 @@
+import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+#One pooled keep-alive session shared by the web search and the NER calls,
+#retrying failed connections twice with a short backoff
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2))
+session.mount('http://', adapter)
+session.mount('https://', adapter)
@@ -1,6 +1,8 @@
 import nltk
 import pickle
+import sys
 import time
+import threading
 import question_classifier
 from question_classifier import ret_answer_type
 import IR
@@ -14,6 +16,14 @@ from score_sentences import score_sentences
 import answer_processing
 from answer_processing import answer_processing
 
+#Runs the web search on a worker thread; any exception is kept in err so the
+#main thread can re-raise it after join() instead of carrying on with no text
+def fetch_paras(question, para, err) :
+    try :
+        para.extend(get_all_links(question))
+    except Exception :
+        err.append(sys.exc_info())
+
 #for question in where_questions :
 #start = time.time()
     #TAKING INPUT
@@ -24,33 +34,48 @@ question = question.lower()
     #MODULE 1 - QUESTION CLASSIFIER
 answer_type = ret_answer_type(question)
     #print 'Answer type :\t', answer_type
+    #No answer type (empty or unrecognised question) means there is nothing
+    #to search for, so the web search and NER calls below are skipped
 
     #MODULE 2 - INFORMATION RETRIEVAL
-if answer_type != "ABBR" :
+if answer_type not in (None, "ABBR") :
         #print 'Fetching information from web'
-    get_all_links(question)
+        #The search runs in the background while the query is formulated
+    para = []
+    err = []
+    fetch = threading.Thread(target=fetch_paras, args=(question, para, err))
+    fetch.start()
 
     #MODULE 3 - FORMULATE QUERY WORDS
-if answer_type != "ABBR" :
+if answer_type not in (None, "ABBR") :
         #print 'Formulating query'
     query = ret_query(question)
         #print query
+    fetch.join()
+    if err :
+        raise err[0][0], err[0][1], err[0][2]
 
     #MODULE 4 - SCORING PARAS AND SENTENCES
-if answer_type != "ABBR" :
+if answer_type not in (None, "ABBR") :
         #print 'Scoring paras'
-    score_paras(query)
+    imp_info = score_paras(query, para)
         #print 'Scoring sentences'
-    final, imp_sentences, maxi, var = score_sentences(query, answer_type)
+    final, imp_sentences, maxi, var = score_sentences(query, answer_type, imp_info)
 
     #MODULE 5 - ANSWER PROCESSING
     #print 'Scoring answers'
-if maxi != 0 and var !=1:
+if answer_type is None :
+    print 'Could not work out what kind of answer the question needs'
+elif answer_type == "ABBR" :
+    #Abbreviations are looked up locally; no paras or sentences are scored
+    answer = answer_processing(answer_type, question, None, None)
+    print answer
+elif maxi != 0 and var !=1:
     answer = answer_processing(answer_type, question, final, imp_sentences)
     #print 'Answer is:\t', answer
     print answer
 else:
-    sentences = open('C:\Python27\BTP\imp_info.txt').read()
+    sentences = ''.join(imp_info)
     print 'relevant information is : \n', sentences
 
 #end = time.time()
@@ -63,12 +88,13 @@ else:
     #records.close()
 
 
-    #DELETING THE TEMPORARY FILES
+    #DELETING TEMPORARY FILES LEFT BY OLDER VERSIONS
+    #The pipeline now keeps its data in memory and no longer writes these
 import os
 directory = 'C:\Python27\BTP'
 os.chdir(directory)
-os.unlink('para.txt')
-os.unlink('imp_info.txt')
-os.unlink('imp_sentences.txt')
+for temp in ['para.txt', 'imp_info.txt', 'imp_sentences.txt'] :
+    if os.path.exists(temp) :
+        os.unlink(temp)
 
 
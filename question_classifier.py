@@ -1,12 +1,19 @@
+import os
 import re
 import nltk
 import random
 import pickle
 
+_SUBCLASS_RE = re.compile('[a-z:]+')
+_ABBR_RE = re.compile('|'.join(map(re.escape, ['full form','stands for','stand for','acronym'])))
+#Answer types keyed by the first word of the question
+_FIRST_WORD_TYPES = {"who": "PERSON", "where": "LOCATION", "when": "DATE"}
+#Answer types keyed by the NaiveBayes question class, except NUM
+_QUESTION_TYPES = {"DESC": "DESC", "ENTY": "ENTY", "HUM": "PERSON", "ABBR": "ABBR", "LOC": "LOCATION"}
+
+#Inputs are single sentences, so Punkt sentence splitting is skipped
 def question_features(post) :
-	features = {}
-	for word in nltk.word_tokenize(post) :
-		features['contains(%s)' % word.lower()] = True
+	features = dict.fromkeys(['contains(%s)' % word.lower() for word in nltk.word_tokenize(post, preserve_line=True)], True)
 	return features
 
 def question_features2(post) :
@@ -32,7 +39,7 @@ def extract_wordtags(words):
 
 def remove_subclasses(wordtags) :
         for i in range(0,len(wordtags)) :
-                wordtags[i] = re.sub('[a-z:]+','',wordtags[i])
+                wordtags[i] = _SUBCLASS_RE.sub('',wordtags[i])
         return wordtags
 
 def remove_tags(words) :
@@ -41,9 +48,7 @@ def remove_tags(words) :
         return words
 
 def make_dictionary(words, wordtags) :
-        keys = words
-        values = wordtags
-        d = {keys[n]:values[n] for n in range(len(keys)) }
+        d = dict(zip(words, wordtags))
         return d
 
 def prepare_pickle_file(classifier):
@@ -51,6 +56,12 @@ def prepare_pickle_file(classifier):
         pickle.dump(classifier, f)
         f.close()
 
+def load_pickle_file():
+        f = open('my_classifier.pickle','rb')
+        classifier = pickle.load(f)
+        f.close()
+        return classifier
+
 def prepare_words_and_wordtags():
         words = read_qs_from_file()
         wordtags = extract_wordtags(words)
@@ -67,43 +78,43 @@ def train_classifier(d, words) :
         print 'Accuracy is:\t',nltk.classify.accuracy(classifier,test_set)
         return classifier
 
+_classifier = None
+
+#Trains the classifier only when no pickled model exists and keeps it in
+#memory for the rest of the process
+def get_classifier() :
+        global _classifier
+        if _classifier is None :
+                if os.path.exists('my_classifier.pickle') :
+                        _classifier = load_pickle_file()
+                else :
+                        d, words = prepare_words_and_wordtags()
+                        _classifier = train_classifier(d, words)
+                        prepare_pickle_file(_classifier)
+        return _classifier
+
 #Changes the question type told by the NaiveBayes QC to the answer type which
 #will be found by the NER
 def find_answer_type2(question_type, question) :
-    if question_type == "DESC" :
-        return "DESC"
-    if question_type == "ENTY" :
-        return "ENTY"
-    if question_type == "HUM" :
-        return "PERSON"
-    if question_type == "ABBR" :
-        return "ABBR"
-    if question_type == "LOC" :
-        return "LOCATION"
     if question_type == "NUM" :
         if question.find("when") != -1 :
             return "DATE"
         else :
             return "NUM"
+    return _QUESTION_TYPES.get(question_type)
 
 def find_answer_type(question):
-        abbs = ['full form','stands for','stand for','acronym']
-        for abb in abbs :
-                if question.find(abb) != -1 :
-                        return "ABBR"
-        first_word = question.split()[0].lower()
-        if first_word == "who" :
-                return "PERSON"
-        if first_word == "where" :
-                return "LOCATION"
-        if first_word == "when" :
-                return "DATE"
+        words = question.split()
+        #An empty question has no type, same as an unrecognised one
+        if not words :
+                return None
+        if _ABBR_RE.search(question) :
+                return "ABBR"
+        first_word = words[0].lower()
+        return _FIRST_WORD_TYPES.get(first_word)
 
 def ret_answer_type2(question) :
-        #Making dictionary out of word and wordtags
-        d, words = prepare_words_and_wordtags()
-        #Training classifier
-        classifier = train_classifier(d, words)
+        classifier = get_classifier()
         question_type = classifier.classify(question_features(question))
         answer_type = find_answer_type2(question_type, question)
         return answer_type